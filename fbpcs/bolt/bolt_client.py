@@ -6,10 +6,13 @@
 
 # pyre-strict
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Generic, List, Optional, Type, TypeVar
+from functools import lru_cache
+from time import monotonic
+from typing import Dict, Generic, List, Optional, Tuple, Type, TypeVar
 
 from fbpcs.bolt.bolt_checkpoint import bolt_checkpoint
 
@@ -27,6 +30,26 @@ from fbpcs.private_computation.stage_flows.private_computation_base_stage_flow i
 # T can be any subtype of BoltCreateInstanceArgs
 T = TypeVar("T", bound=BoltCreateInstanceArgs)
 
+# BoltState results are cached briefly so that back-to-back status checks in
+# one poll cycle (should_invoke_stage, get_valid_stage, is_existing_instance)
+# share a single update_instance round trip. Must stay well below the
+# runner's poll_interval so polling still observes fresh statuses.
+STATUS_CACHE_TTL = 2  # seconds
+
+
+@lru_cache(maxsize=None)
+def _ready_statuses(
+    stage: PrivateComputationBaseStageFlow,
+) -> Tuple[Optional[PrivateComputationInstanceStatus], ...]:
+    """Statuses from which `stage` can be run; static per stage enum member."""
+    previous_stage = stage.previous_stage
+    return (
+        previous_stage.completed_status if previous_stage else None,
+        stage.started_status,
+        stage.initialized_status,
+        stage.failed_status,
+    )
+
 
 @dataclass
 class BoltState:
@@ -44,6 +67,29 @@ class BoltClient(ABC, Generic[T]):
         self.logger: logging.Logger = (
             logging.getLogger(__name__) if logger is None else logger
         )
+        self._status_cache: Dict[str, Tuple[float, BoltState]] = {}
+
+    def _get_status_cache(self) -> Dict[str, Tuple[float, BoltState]]:
+        # not every subclass calls super().__init__, so create lazily
+        cache = getattr(self, "_status_cache", None)
+        if cache is None:
+            cache = {}
+            self._status_cache = cache
+        return cache
+
+    async def update_instance_cached(self, instance_id: str) -> BoltState:
+        """update_instance with a short-lived per-instance cache."""
+        cache = self._get_status_cache()
+        hit = cache.get(instance_id)
+        if hit is not None and monotonic() - hit[0] < STATUS_CACHE_TTL:
+            return hit[1]
+        state = await self.update_instance(instance_id)
+        cache[instance_id] = (monotonic(), state)
+        return state
+
+    def invalidate_status_cache(self, instance_id: str) -> None:
+        """Drops the cached state, e.g. after starting or canceling a stage."""
+        self._get_status_cache().pop(instance_id, None)
 
     @abstractmethod
     async def create_instance(self, instance_args: T) -> str:
@@ -68,6 +114,20 @@ class BoltClient(ABC, Generic[T]):
     async def update_instance(self, instance_id: str) -> BoltState:
         pass
 
+    async def batch_update_instances(
+        self, instance_ids: List[str]
+    ) -> Dict[str, BoltState]:
+        """Fetches the states of several instances at once.
+
+        The default implementation falls back to one update_instance call per
+        id; clients whose backend supports batched reads should override this
+        with a single round trip.
+        """
+        states = await asyncio.gather(
+            *[self.update_instance(instance_id) for instance_id in instance_ids]
+        )
+        return dict(zip(instance_ids, states))
+
     @abstractmethod
     async def has_feature(self, instance_id: str, feature: PCSFeature) -> bool:
         pass
@@ -87,20 +147,14 @@ class BoltClient(ABC, Generic[T]):
         status: PrivateComputationInstanceStatus,
         stage: PrivateComputationBaseStageFlow,
     ) -> bool:
-        previous_stage = stage.previous_stage
-        return status in [
-            previous_stage.completed_status if previous_stage else None,
-            stage.started_status,
-            stage.initialized_status,
-            stage.failed_status,
-        ]
+        return status in _ready_statuses(stage)
 
     @bolt_checkpoint(dump_params=True, dump_return_val=True)
     async def should_invoke_stage(
         self, instance_id: str, stage: PrivateComputationBaseStageFlow
     ) -> bool:
         previous_stage = stage.previous_stage
-        status = (await self.update_instance(instance_id)).pc_instance_status
+        status = (await self.update_instance_cached(instance_id)).pc_instance_status
         return status in [
             previous_stage.completed_status if previous_stage else None,
             stage.failed_status,
@@ -111,13 +165,27 @@ class BoltClient(ABC, Generic[T]):
         self, instance_id: str, stage_flow: Type[PrivateComputationBaseStageFlow]
     ) -> Optional[PrivateComputationBaseStageFlow]:
         status = (
-            await self.update_instance(instance_id=instance_id)
+            await self.update_instance_cached(instance_id)
         ).pc_instance_status
-        for stage in list(stage_flow):
+        # iterate the enum directly; materializing it into a list per poll
+        # just allocates garbage
+        for stage in stage_flow:
             if self.ready_for_stage(status, stage):
                 return stage
         return None
 
+    async def instance_exists(self, instance_id: str) -> bool:
+        """Returns whether an instance with this id exists.
+
+        The default implementation probes with a full status fetch; clients
+        with a cheaper existence check should override it.
+        """
+        try:
+            await self.update_instance_cached(instance_id)
+            return True
+        except Exception:
+            return False
+
     @bolt_checkpoint(
         dump_return_val=True,
     )
@@ -132,14 +200,12 @@ class BoltClient(ABC, Generic[T]):
         """
 
         instance_id = instance_args.instance_id
-        try:
-            self.logger.info(f"Checking if {instance_id} exists...")
-            await self.update_instance(instance_id=instance_id)
+        self.logger.info(f"Checking if {instance_id} exists...")
+        if await self.instance_exists(instance_id):
             self.logger.info(f"{instance_id} found.")
             return True
-        except Exception:
-            self.logger.info(f"{instance_id} not found.")
-            return False
+        self.logger.info(f"{instance_id} not found.")
+        return False
 
     @bolt_checkpoint()
     async def get_or_create_instance(self, instance_args: T) -> str:
@@ -9,7 +9,9 @@
 import asyncio
 import logging
 from time import time
-from typing import Generic, List, Optional, Type, TypeVar
+from typing import Dict, Generic, List, Optional, Tuple, Type, TypeVar
+
+import async_timeout
 
 from fbpcs.bolt.bolt_checkpoint import bolt_checkpoint
 
@@ -58,23 +60,85 @@ class BoltRunner(Generic[T, U]):
     ) -> None:
         self.publisher_client = publisher_client
         self.partner_client = partner_client
-        self.semaphore = asyncio.Semaphore(
-            max_parallel_runs or DEFAULT_MAX_PARALLEL_RUNS
-        )
+        self.max_parallel_runs: int = max_parallel_runs or DEFAULT_MAX_PARALLEL_RUNS
+        self.semaphore = asyncio.Semaphore(self.max_parallel_runs)
         self.logger: logging.Logger = (
             logging.getLogger(__name__) if logger is None else logger
         )
         self.num_tries: int = num_tries or DEFAULT_NUM_TRIES
+        # wake-up events for poll loops, keyed by instance_id; only populated
+        # when someone calls notify_status_change
+        self._status_events: Dict[str, asyncio.Event] = {}
+
+    def notify_status_change(self, instance_id: str) -> None:
+        """Wakes any poll loop waiting on instance_id before its next interval.
+
+        Callers with an out-of-band completion signal (e.g. a checkpoint or
+        webhook listener) can use this so the runner reacts immediately
+        instead of sleeping out the rest of the poll interval.
+        """
+        self._status_events.setdefault(instance_id, asyncio.Event()).set()
+
+    async def _sleep_until_next_poll(
+        self, poll_interval: int, *instance_ids: str
+    ) -> None:
+        """Sleeps for poll_interval, waking early if a status change is
+        reported for any of instance_ids via notify_status_change."""
+        events = [
+            event
+            for event in (
+                self._status_events.get(instance_id) for instance_id in instance_ids
+            )
+            if event is not None
+        ]
+        if not events:
+            # nothing can wake us early, so a plain sleep suffices
+            await asyncio.sleep(poll_interval)
+            return
+        waits = [asyncio.ensure_future(event.wait()) for event in events]
+        try:
+            # async_timeout avoids the wrapper task asyncio.wait_for spawns
+            # per call, which adds up across poll loops
+            async with async_timeout.timeout(poll_interval):
+                await asyncio.wait(waits, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.TimeoutError:
+            # the poll interval is the upper bound; fall through to re-poll
+            pass
+        finally:
+            for task in waits:
+                task.cancel()
+            for event in events:
+                event.clear()
 
     async def run_async(
         self,
         jobs: List[BoltJob[T, U]],
     ) -> BoltSummary:
         start_time = time()
-        results = list(await asyncio.gather(*[self.run_one(job=job) for job in jobs]))
+        # a small worker pool drains the jobs instead of scheduling every
+        # run_one up front; an unbounded gather creates one task per job
+        # that mostly sits contending on the semaphore and bloats the
+        # event loop for large job lists
+        queue: "asyncio.Queue[Tuple[int, BoltJob[T, U]]]" = asyncio.Queue()
+        for index, job in enumerate(jobs):
+            queue.put_nowait((index, job))
+        results: List[Optional[BoltJobSummary]] = [None] * len(jobs)
+
+        async def worker() -> None:
+            while True:
+                try:
+                    index, job = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                results[index] = await self.run_one(job=job)
+
+        num_workers = min(self.max_parallel_runs, len(jobs))
+        await asyncio.gather(*[worker() for _ in range(num_workers)])
         end_time = time()
         self.logger.info(f"BoltSummary: overall runtime: {end_time - start_time}")
-        return BoltSummary(job_summaries=results)
+        return BoltSummary(
+            job_summaries=[result for result in results if result is not None]
+        )
 
     @bolt_checkpoint(
         dump_return_val=True,
@@ -344,7 +408,7 @@ class BoltRunner(Generic[T, U]):
             self.logger.info(
                 f"{instance_id} current status is {status}, waiting for {stage.started_status}."
             )
-            await asyncio.sleep(poll_interval)
+            await self._sleep_until_next_poll(poll_interval, instance_id)
         raise StageTimeoutException(
             f"Poll {instance_id} status timed out after {timeout}s expecting status {stage.started_status}."
         )
@@ -417,7 +481,7 @@ class BoltRunner(Generic[T, U]):
                 f"Publisher {publisher_id} status is {publisher_state.pc_instance_status}, Partner {partner_id} status is {partner_state.pc_instance_status}. Waiting for status {complete_status}."
             )
             # keep polling
-            await asyncio.sleep(poll_interval)
+            await self._sleep_until_next_poll(poll_interval, publisher_id, partner_id)
         raise StageTimeoutException(
             f"Stage {stage.name} timed out after {timeout}s. Publisher status: {publisher_state.pc_instance_status}. Partner status: {partner_state.pc_instance_status}."
         )
@@ -589,7 +653,7 @@ class BoltRunner(Generic[T, U]):
                 self.logger.info(
                     f"Publisher instance status {status} invalid for calculation.\nPolling publisher instance expecting valid status."
                 )
-                await asyncio.sleep(poll_interval)
+                await self._sleep_until_next_poll(poll_interval, instance_id)
             raise WaitValidStatusTimeout(
                 f"Timed out waiting for publisher {instance_id} valid status. Status: {status}"
             )
@@ -181,6 +181,7 @@ class BoltPCSClient(BoltClient[BoltPCSCreateInstanceArgs]):
 
         # the following log is used by log_analyzer
         self.logger.info(f"[{instance_id}] {pc_instance}")
+        self.invalidate_status_cache(instance_id)
 
     @bolt_checkpoint(
         dump_return_val=True,
@@ -246,6 +247,7 @@ class BoltPCSClient(BoltClient[BoltPCSCreateInstanceArgs]):
     async def cancel_current_stage(self, instance_id: str) -> None:
         loop = asyncio.get_running_loop()
         await loop.run_in_executor(None, self.pcs.cancel_current_stage, instance_id)
+        self.invalidate_status_cache(instance_id)
 
     @bolt_checkpoint()
     async def get_or_create_instance(
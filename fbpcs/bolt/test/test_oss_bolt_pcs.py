@@ -222,6 +222,8 @@ class TestBoltPCSClient(unittest.IsolatedAsyncioTestCase):
                 self.bolt_pcs_client.update_instance = mock.AsyncMock(
                     return_value=BoltState(status)
                 )
+                # each subTest expects a fresh status fetch
+                self.bolt_pcs_client.invalidate_status_cache("test_id")
                 valid_stage = await self.bolt_pcs_client.get_valid_stage(
                     "test_id", PrivateComputationStageFlow
                 )
@@ -235,6 +237,10 @@ class TestBoltPCSClient(unittest.IsolatedAsyncioTestCase):
         )
         for expected_result in (True, False):
             with self.subTest(expected_result=expected_result):
+                # each subTest expects a fresh status fetch
+                self.bolt_pcs_client.invalidate_status_cache(
+                    mock_instance_args.instance_id
+                )
                 actual_result = await self.bolt_pcs_client.is_existing_instance(
                     instance_args=mock_instance_args
                 )
@@ -318,6 +324,8 @@ class TestBoltPCSClient(unittest.IsolatedAsyncioTestCase):
                 self.bolt_pcs_client.update_instance = mock.AsyncMock(
                     return_value=BoltState(status)
                 )
+                # each subTest expects a fresh status fetch
+                self.bolt_pcs_client.invalidate_status_cache("instance_id")
                 actual_result = await self.bolt_pcs_client.should_invoke_stage(
                     "instance_id", stage
                 )
@@ -8,13 +8,15 @@ import json
 import logging
 import os
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 
+import aiohttp
 import requests
 from fbpcs.bolt.bolt_checkpoint import bolt_checkpoint
 from fbpcs.bolt.bolt_client import BoltClient, BoltState
 from fbpcs.bolt.bolt_job import BoltCreateInstanceArgs
 from fbpcs.bolt.constants import FBPCS_GRAPH_API_TOKEN
+from fbpcs.pl_coordinator.constants import MAX_NUM_INSTANCES
 from fbpcs.pl_coordinator.exceptions import (
     GraphAPIGenericException,
     GraphAPITokenNotFound,
@@ -29,6 +31,13 @@ from fbpcs.private_computation.stage_flows.private_computation_base_stage_flow i
 from fbpcs.utils.config_yaml.config_yaml_dict import ConfigYamlDict
 from fbpcs.utils.config_yaml.exceptions import ConfigYamlBaseException
 
+# orjson parses straight from bytes and is considerably faster than stdlib
+# json, but it is an optional speedup rather than a hard dependency
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 GRAPHAPI_HTTPS = "https://"
 GRAPHAPI_DEFAULT_DOMAIN = "graph.facebook.com"
 GRAPHAPI_DEFAULT_VERSION = "v13.0"
@@ -45,6 +54,29 @@ GRAPHAPI_INSTANCE_STATUSES: Dict[str, PrivateComputationInstanceStatus] = {
 }
 
 
+@dataclass
+class GraphAPIResponse:
+    """Materialized Graph API response body.
+
+    aiohttp response bodies can only be read while the request context is
+    open, so the async client methods read them eagerly and return this
+    wrapper, which mirrors the parts of requests.Response that call sites
+    rely on.
+    """
+
+    status_code: int
+    content: bytes
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8")
+
+    def json(self) -> Any:
+        if orjson is not None:
+            return orjson.loads(self.content)
+        return json.loads(self.content)
+
+
 @dataclass
 class BoltPLGraphAPICreateInstanceArgs(BoltCreateInstanceArgs):
     instance_id: str  # used for temporary resuming solution
@@ -95,6 +127,27 @@ class BoltGraphAPIClient(BoltClient[BoltGraphAPICreateInstanceArgs]):
         self.logger.info(f"GraphAPI URL: {self.graphapi_url}")
         self.access_token = self._get_graph_api_token(config)
         self.params = {"access_token": self.access_token}
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # created lazily so that the session is bound to the running event loop
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=MAX_NUM_INSTANCES)
+            )
+        return self._session
+
+    async def close_session(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def _get(self, url: str, params: Dict[str, Any]) -> GraphAPIResponse:
+        async with self._get_session().get(url, params=params) as r:
+            return GraphAPIResponse(status_code=r.status, content=await r.read())
+
+    async def _post(self, url: str, params: Dict[str, Any]) -> GraphAPIResponse:
+        async with self._get_session().post(url, params=params) as r:
+            return GraphAPIResponse(status_code=r.status, content=await r.read())
 
     @bolt_checkpoint(dump_params=True, dump_return_val=True)
     async def create_instance(
@@ -147,6 +200,7 @@ class BoltGraphAPIClient(BoltClient[BoltGraphAPICreateInstanceArgs]):
         else:
             msg = "running next stage"
         self._check_err(r, msg)
+        self.invalidate_status_cache(instance_id)
 
     @bolt_checkpoint()
     async def cancel_current_stage(
@@ -163,12 +217,43 @@ class BoltGraphAPIClient(BoltClient[BoltGraphAPICreateInstanceArgs]):
         else:
             msg = "cancel current stage."
         self._check_err(r, msg)
+        self.invalidate_status_cache(instance_id)
 
     @bolt_checkpoint(
         dump_return_val=True,
     )
     async def update_instance(self, instance_id: str) -> BoltState:
-        response = json.loads((await self.get_instance(instance_id)).text)
+        response = await self.get_instance(instance_id)
+        return self._to_bolt_state(response)
+
+    @bolt_checkpoint(
+        dump_params=True,
+    )
+    async def batch_update_instances(
+        self, instance_ids: List[str]
+    ) -> Dict[str, BoltState]:
+        """Fetches the states of several instances in one batched Graph API call."""
+        if not instance_ids:
+            return {}
+        params = self.params.copy()
+        params["batch"] = json.dumps(
+            [
+                {"method": "GET", "relative_url": instance_id}
+                for instance_id in instance_ids
+            ]
+        )
+        r = await self._post(self.graphapi_url, params)
+        self._check_err(r, "batch updating fb instances")
+        states = {}
+        for instance_id, sub_response in zip(instance_ids, r.json()):
+            if not sub_response or sub_response.get("code") != 200:
+                raise GraphAPIGenericException(
+                    f"Error updating instance {instance_id} in batch: {sub_response}"
+                )
+            states[instance_id] = self._to_bolt_state(json.loads(sub_response["body"]))
+        return states
+
+    def _to_bolt_state(self, response: Dict[str, Any]) -> BoltState:
         response_status = response.get("status")
         try:
             status = GRAPHAPI_INSTANCE_STATUSES[response_status]
@@ -195,6 +280,17 @@ class BoltGraphAPIClient(BoltClient[BoltGraphAPICreateInstanceArgs]):
                 "This method should not be called with expected results"
             )
 
+    async def instance_exists(self, instance_id: str) -> bool:
+        """Checks existence with a minimal ?fields=id GET.
+
+        Avoids the full status payload (server ips, tier, feature list) that
+        update_instance fetches just to be discarded.
+        """
+        params = self.params.copy()
+        params["fields"] = "id"
+        r = await self._get(f"{self.graphapi_url}/{instance_id}", params)
+        return r.status_code == 200
+
     @bolt_checkpoint(
         dump_return_val=True,
     )
@@ -205,20 +301,18 @@ class BoltGraphAPIClient(BoltClient[BoltGraphAPICreateInstanceArgs]):
         instance_id = instance_args.instance_id
         self.logger.info(f"Checking if {instance_id} exists...")
         if instance_id:
-            try:
-                await self.update_instance(instance_id)
+            if await self.instance_exists(instance_id):
                 self.logger.info(f"{instance_id} found.")
                 return True
-            except Exception:
-                self.logger.info(f"{instance_id} not found.")
-                return False
+            self.logger.info(f"{instance_id} not found.")
+            return False
         else:
             self.logger.info("instance_id is empty, fetching a valid one")
             return False
 
     @bolt_checkpoint(dump_params=True, dump_return_val=True)
     async def has_feature(self, instance_id: str, feature: PCSFeature) -> bool:
-        response = json.loads((await self.get_instance(instance_id)).text)
+        response = await self.get_instance(instance_id)
         feature_list = response.get("feature_list")
         if feature_list:
             pcs_feature_enums = {
@@ -227,10 +321,10 @@ class BoltGraphAPIClient(BoltClient[BoltGraphAPICreateInstanceArgs]):
             return feature in pcs_feature_enums
         return False
 
-    async def get_instance(self, instance_id: str) -> requests.Response:
-        r = requests.get(f"{self.graphapi_url}/{instance_id}", self.params)
+    async def get_instance(self, instance_id: str) -> Dict[str, Any]:
+        r = await self._get(f"{self.graphapi_url}/{instance_id}", self.params)
         self._check_err(r, "getting fb instance")
-        return r
+        return r.json()
 
     def _get_graph_api_token(self, config: Dict[str, Any]) -> str:
         """Get graph API token from config.yml or the {FBPCS_GRAPH_API_TOKEN} env var
@@ -264,19 +358,23 @@ class BoltGraphAPIClient(BoltClient[BoltGraphAPICreateInstanceArgs]):
             )
         return token
 
-    def _check_err(self, r: requests.Response, msg: str) -> None:
+    def _check_err(
+        self, r: Union[requests.Response, GraphAPIResponse], msg: str
+    ) -> None:
         if r.status_code != 200:
             err_msg = f"Error {msg}: {r.content}"
             self.logger.error(err_msg)
             raise GraphAPIGenericException(err_msg)
 
     @bolt_checkpoint(dump_params=True, include=["adspixels_id"])
-    def get_adspixels(self, adspixels_id: str, fields: List[str]) -> requests.Response:
+    async def get_adspixels(
+        self, adspixels_id: str, fields: List[str]
+    ) -> Dict[str, Any]:
         params = self.params.copy()
         params["fields"] = ",".join(fields)
-        r = requests.get(f"{self.graphapi_url}/{adspixels_id}", params=params)
+        r = await self._get(f"{self.graphapi_url}/{adspixels_id}", params)
         self._check_err(r, "getting adspixels data")
-        return r
+        return r.json()
 
     def get_debug_token_data(self) -> requests.Response:
         params = self.params.copy()
@@ -294,20 +392,19 @@ class BoltGraphAPIClient(BoltClient[BoltGraphAPICreateInstanceArgs]):
         return r
 
     @bolt_checkpoint(dump_params=True, include=["dataset_id"])
-    def get_attribution_dataset_info(
+    async def get_attribution_dataset_info(
         self, dataset_id: str, fields: List[str]
-    ) -> requests.Response:
+    ) -> Dict[str, Any]:
         params = self.params.copy()
         params["fields"] = ",".join(fields)
-        r = requests.get(f"{self.graphapi_url}/{dataset_id}", params=params)
+        r = await self._get(f"{self.graphapi_url}/{dataset_id}", params)
         self._check_err(r, "getting dataset information")
-        return r
+        return r.json()
 
     @bolt_checkpoint(
         dump_params=True,
     )
-    def get_existing_pa_instances(self, dataset_id: str) -> requests.Response:
-        params = self.params.copy()
-        r = requests.get(f"{self.graphapi_url}/{dataset_id}/instances", params=params)
+    async def get_existing_pa_instances(self, dataset_id: str) -> Dict[str, Any]:
+        r = await self._get(f"{self.graphapi_url}/{dataset_id}/instances", self.params)
         self._check_err(r, "getting attribution instances tied to the dataset")
-        return r
+        return r.json()
@@ -174,24 +174,27 @@ async def run_study_async(
     # sets a unique default run id if run_id was None
     run_id = bolt_checkpoint.register_run_id(run_id)
 
-    return await _run_study_async_helper(
-        client=client,
-        trace_logging_svc=trace_logging_svc,
-        config=config,
-        study_id=study_id,
-        objective_ids=objective_ids,
-        input_paths=input_paths,
-        logger=logger,
-        stage_flow=stage_flow,
-        num_tries=num_tries,
-        dry_run=dry_run,
-        result_visibility=result_visibility,
-        final_stage=final_stage,
-        run_id=run_id,
-        graphapi_version=graphapi_version,
-        output_dir=output_dir,
-        graphapi_domain=graphapi_domain,
-    )
+    try:
+        return await _run_study_async_helper(
+            client=client,
+            trace_logging_svc=trace_logging_svc,
+            config=config,
+            study_id=study_id,
+            objective_ids=objective_ids,
+            input_paths=input_paths,
+            logger=logger,
+            stage_flow=stage_flow,
+            num_tries=num_tries,
+            dry_run=dry_run,
+            result_visibility=result_visibility,
+            final_stage=final_stage,
+            run_id=run_id,
+            graphapi_version=graphapi_version,
+            output_dir=output_dir,
+            graphapi_domain=graphapi_domain,
+        )
+    finally:
+        await client.close_session()
 
 
 @bolt_checkpoint(
@@ -238,7 +241,7 @@ async def _run_study_async_helper(
     _verify_study_type(study_data)
 
     # verify mpc objectives
-    _verify_mpc_objs(study_data, objective_ids, client)
+    await _verify_mpc_objs(study_data, objective_ids, client)
 
     # verify study opp_data_information is non-empty
     if OPP_DATA_INFORMATION not in study_data:
@@ -502,14 +505,14 @@ def _verify_study_type(study_data: Dict[str, Any]) -> None:
 
 
 @bolt_checkpoint(dump_params=True, include=["adpixels_ids"], component=LOG_COMPONENT)
-def _verify_adspixels_if_exist(
+async def _verify_adspixels_if_exist(
     adspixels_ids: List[str],
     client: BoltGraphAPIClient[BoltPLGraphAPICreateInstanceArgs],
 ) -> None:
     if adspixels_ids:
         try:
             for pixel_id in adspixels_ids:
-                client.get_adspixels(adspixels_id=pixel_id, fields=["id"])
+                await client.get_adspixels(adspixels_id=pixel_id, fields=["id"])
         except GraphAPIGenericException:
             raise PCStudyValidationException(
                 cause=f"Read adspixel {adspixels_ids} failed.",
@@ -519,7 +522,7 @@ def _verify_adspixels_if_exist(
 
 
 @bolt_checkpoint(component=LOG_COMPONENT)
-def _verify_mpc_objs(
+async def _verify_mpc_objs(
     study_data: Dict[str, Any],
     objective_ids: List[str],
     client: BoltGraphAPIClient[BoltPLGraphAPICreateInstanceArgs],
@@ -546,7 +549,7 @@ def _verify_mpc_objs(
             for pixel in adspixels:
                 adspixels_ids.append(pixel["id"])
 
-    _verify_adspixels_if_exist(adspixels_ids, client)
+    await _verify_adspixels_if_exist(adspixels_ids, client)
 
     mpc_objectives_ids = [obj["id"] for obj in mpc_objectives]
     # verify input objs are MPC objs of this study.
@@ -810,9 +813,7 @@ async def _check_versions(
             instance_id = instance_data["instance_id"]
             # if there is no tier for some reason (e.g. old study?), let's just assume
             # the tier is correct
-            tier_str = json.loads((await client.get_instance(instance_id)).text).get(
-                "tier"
-            )
+            tier_str = (await client.get_instance(instance_id)).get("tier")
             if tier_str:
                 expected_tier = PCSTier.from_str(tier_str)
                 if expected_tier is not config_tier:
@@ -830,9 +831,7 @@ async def _get_pcs_features(
         for objective_id in cell_obj_instances[cell_id]:
             instance_data = cell_obj_instances[cell_id][objective_id]
             instance_id = instance_data["instance_id"]
-            feature_list = json.loads(
-                (await client.get_instance(instance_id)).text
-            ).get("feature_list")
+            feature_list = (await client.get_instance(instance_id)).get("feature_list")
             if feature_list:
                 return feature_list
 
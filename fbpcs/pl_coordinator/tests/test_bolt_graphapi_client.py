@@ -6,10 +6,8 @@
 
 import json
 import unittest
-from typing import Any
-from unittest.mock import AsyncMock, MagicMock, patch, PropertyMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
-import requests
 from fbpcs.bolt.constants import FBPCS_GRAPH_API_TOKEN
 from fbpcs.pl_coordinator.bolt_graphapi_client import (
     BoltGraphAPIClient,
@@ -18,6 +16,7 @@ from fbpcs.pl_coordinator.bolt_graphapi_client import (
     GRAPHAPI_DEFAULT_DOMAIN,
     GRAPHAPI_DEFAULT_VERSION,
     GRAPHAPI_HTTPS,
+    GraphAPIResponse,
 )
 from fbpcs.pl_coordinator.exceptions import GraphAPITokenNotFound
 from fbpcs.private_computation.entity.pcs_feature import PCSFeature
@@ -187,9 +186,11 @@ class TestBoltGraphAPIClient(unittest.IsolatedAsyncioTestCase):
         new_callable=AsyncMock,
     )
     async def test_bolt_update_instance(self, mock_get_instance) -> None:
-        mock_get_instance.return_value = self._get_graph_api_output(
-            {"id": "id", "status": "COMPUTATION_STARTED", "server_ips": "1.1.1.1"}
-        )
+        mock_get_instance.return_value = {
+            "id": "id",
+            "status": "COMPUTATION_STARTED",
+            "server_ips": "1.1.1.1",
+        }
         state = await self.test_client.update_instance("id")
         self.assertEqual(
             state.pc_instance_status,
@@ -197,13 +198,49 @@ class TestBoltGraphAPIClient(unittest.IsolatedAsyncioTestCase):
         )
         self.assertEqual(state.server_ips, "1.1.1.1")
 
+    @patch(
+        "fbpcs.pl_coordinator.bolt_graphapi_client.BoltGraphAPIClient._post",
+        new_callable=AsyncMock,
+    )
+    async def test_bolt_batch_update_instances(self, mock_post) -> None:
+        batch_body = [
+            {
+                "code": 200,
+                "body": json.dumps(
+                    {
+                        "id": "id1",
+                        "status": "COMPUTATION_STARTED",
+                        "server_ips": "1.1.1.1",
+                    }
+                ),
+            },
+            {
+                "code": 200,
+                "body": json.dumps({"id": "id2", "status": "RESULT_READY"}),
+            },
+        ]
+        mock_post.return_value = GraphAPIResponse(
+            status_code=200, content=json.dumps(batch_body).encode("utf-8")
+        )
+        states = await self.test_client.batch_update_instances(["id1", "id2"])
+        mock_post.assert_called_once()
+        self.assertEqual(
+            states["id1"].pc_instance_status,
+            PrivateComputationInstanceStatus.COMPUTATION_STARTED,
+        )
+        self.assertEqual(states["id1"].server_ips, "1.1.1.1")
+        self.assertEqual(
+            states["id2"].pc_instance_status,
+            PrivateComputationInstanceStatus.AGGREGATION_COMPLETED,
+        )
+
     @patch(
         "fbpcs.pl_coordinator.bolt_graphapi_client.BoltGraphAPIClient.get_instance",
         new_callable=AsyncMock,
     )
     async def test_bolt_has_feature(self, mock_get_instance) -> None:
         data = {"status": 200, "feature_list": [PCSFeature.PCS_DUMMY.value]}
-        mock_get_instance.return_value = self._get_graph_api_output(data)
+        mock_get_instance.return_value = data
         for pcs_feature, expected_result in [
             (PCSFeature.PCS_DUMMY, True),
             (PCSFeature.PRIVATE_LIFT_PCF2_RELEASE, False),
@@ -226,41 +263,40 @@ class TestBoltGraphAPIClient(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(NotImplementedError):
             await self.test_client.validate_results("id", expected_result_path)
 
+    @patch(
+        "fbpcs.pl_coordinator.bolt_graphapi_client.BoltGraphAPIClient._get",
+        new_callable=AsyncMock,
+    )
+    async def test_instance_exists(self, mock_get) -> None:
+        for status_code, expected_result in ((200, True), (404, False)):
+            with self.subTest(status_code=status_code):
+                mock_get.return_value = GraphAPIResponse(
+                    status_code=status_code, content=b'{"id": "id"}'
+                )
+                self.assertEqual(
+                    await self.test_client.instance_exists("id"), expected_result
+                )
+
     @patch("fbpcs.bolt.bolt_job.BoltCreateInstanceArgs")
-    @patch("fbpcs.bolt.bolt_client.BoltState")
     @patch(
-        "fbpcs.pl_coordinator.bolt_graphapi_client.BoltGraphAPIClient.update_instance",
+        "fbpcs.pl_coordinator.bolt_graphapi_client.BoltGraphAPIClient.instance_exists",
         new_callable=AsyncMock,
     )
-    async def test_is_existing_instance(
-        self, mock_update, mock_state, mock_args
-    ) -> None:
-        for instance_id, update_successful, expected_result in [
+    async def test_is_existing_instance(self, mock_exists, mock_args) -> None:
+        for instance_id, exists, expected_result in [
             ("", True, False),
             ("", False, False),
             ("id", True, True),
             ("id", False, False),
         ]:
-            mock_update.side_effect = mock_state if update_successful else Exception()
+            mock_exists.return_value = exists
             mock_args.instance_id = instance_id
             with self.subTest(
                 instance_id=instance_id,
-                update_successful=update_successful,
+                exists=exists,
                 expected_result=expected_result,
             ):
                 actual_result = await self.test_client.is_existing_instance(mock_args)
                 self.assertEqual(actual_result, expected_result)
                 if not instance_id:
-                    mock_update.assert_not_called()
-
-    def _get_graph_api_output(self, text: Any) -> requests.Response:
-        r = requests.Response()
-        r.status_code = 200
-        # pyre-ignore
-        type(r).text = PropertyMock(return_value=json.dumps(text))
-
-        def json_func(**kwargs) -> Any:
-            return text
-
-        r.json = json_func
-        return r
+                    mock_exists.assert_not_called()
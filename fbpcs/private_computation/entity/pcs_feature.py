@@ -8,6 +8,7 @@
 
 import logging
 from enum import Enum
+from functools import lru_cache
 
 
 class PCSFeature(Enum):
@@ -47,9 +48,19 @@ class PCSFeature(Enum):
         if len(feature_str) <= 1:
             raise ValueError("Features of length <= 1 not supported. Check your config")
 
-        feature_str = feature_str.casefold()
-        try:
-            return PCSFeature(feature_str)
-        except ValueError:
-            logging.warning(f"can't map {feature_str} to pre-defined PCSFeature")
-            return PCSFeature.UNKNOWN
+        return _pcs_feature_from_str(feature_str.casefold())
+
+
+@lru_cache(maxsize=None)
+def _pcs_feature_from_str(feature_str: str) -> PCSFeature:
+    """Resolves a casefolded feature string to a PCSFeature.
+
+    Cached because unknown strings fall through to _missing_, a linear scan
+    over the members, and the same feature strings recur on every instance
+    in a batched run.
+    """
+    try:
+        return PCSFeature(feature_str)
+    except ValueError:
+        logging.warning(f"can't map {feature_str} to pre-defined PCSFeature")
+        return PCSFeature.UNKNOWN
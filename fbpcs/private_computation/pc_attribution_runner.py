@@ -6,15 +6,13 @@
 
 
 import asyncio
-
-import json
 import logging
 import sys
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Iterable, List, Optional, Type
+from functools import lru_cache
+from time import monotonic
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
 
-import dateutil.parser
-import pytz
 from fbpcs.bolt.bolt_checkpoint import bolt_checkpoint
 from fbpcs.bolt.bolt_job import BoltJob, BoltPlayerArgs
 from fbpcs.bolt.bolt_runner import BoltRunner
@@ -52,12 +50,11 @@ from fbpcs.private_computation.entity.product_config import (
 from fbpcs.private_computation.stage_flows.private_computation_base_stage_flow import (
     PrivateComputationBaseStageFlow,
 )
-from fbpcs.private_computation_cli.private_computation_service_wrapper import (
-    build_private_computation_service,
-    get_tier,
-    get_trace_logging_service,
-)
 
+# pytz, dateutil and the private_computation_service_wrapper (which pulls in
+# the whole PCS service stack) are imported lazily at their use sites so that
+# light-weight callers like get_runnable_timestamps don't pay their import
+# cost at module load
 
 # dataset information fields
 DATASETS_INFORMATION = "datasets_information"
@@ -83,6 +80,55 @@ TERMINAL_STATUSES = [
 
 LOG_COMPONENT = "pc_attribution_runner"
 
+
+@lru_cache(maxsize=1)
+def _pacific_timezone() -> Any:
+    """Loads the US/Pacific pytz timezone once, on first use.
+
+    Loading a pytz timezone parses tzdata from disk, so it is cached; the
+    import is local so callers that never hit the date path skip pytz
+    entirely.
+    """
+    import pytz
+
+    return pytz.timezone("US/Pacific")
+
+
+# Batch workflows (e.g. get_runnable_timestamps for several attribution rules
+# followed by run_attribution) hit the same dataset repeatedly; memoize the
+# Graph API results per dataset for a short window instead of re-fetching.
+DATASET_CACHE_TTL = 60  # seconds
+
+_dataset_info_cache: Dict[str, Tuple[float, Any]] = {}
+_pa_instances_cache: Dict[str, Tuple[float, Any]] = {}
+
+
+def _invalidate_dataset_cache(dataset_id: str) -> None:
+    """Drops cached dataset info/instance lists for a dataset.
+
+    Must be called after creating a new instance so a stale instance list
+    doesn't mask the just-created instance.
+    """
+    _dataset_info_cache.pop(dataset_id, None)
+    _pa_instances_cache.pop(dataset_id, None)
+
+
+_event_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Returns a process-wide event loop for the synchronous entry points.
+
+    asyncio.run creates and tears down a fresh loop (selector, default
+    executor) per call, which adds up for callers that invoke
+    run_attribution once per runnable timestamp; reuse one loop instead.
+    """
+    global _event_loop
+    if _event_loop is None or _event_loop.is_closed():
+        _event_loop = asyncio.new_event_loop()
+    return _event_loop
+
+
 """
 The input to this function will be the input path, the dataset_id as well as the following params to choose
 a specific dataset range to create and run a PA instance on
@@ -111,7 +157,7 @@ def run_attribution(
     graphapi_version: Optional[str] = None,
     graphapi_domain: Optional[str] = None,
 ) -> None:
-    bolt_summary = asyncio.run(
+    bolt_summary = _get_event_loop().run_until_complete(
         run_attribution_async(
             config=config,
             dataset_id=dataset_id,
@@ -170,6 +216,11 @@ async def run_attribution_async(
         access_token=client.access_token,
         endpoint_url=endpoint_url,
     )
+    # deferred: pulls in the PCS service stack
+    from fbpcs.private_computation_cli.private_computation_service_wrapper import (
+        get_trace_logging_service,
+    )
+
     # if the user configured a trace logging service via the config.yml file, use that
     # instead of the default trace logger
     trace_logging_svc = get_trace_logging_service(
@@ -181,26 +232,29 @@ async def run_attribution_async(
     # sets a unique default run id if run_id was None
     run_id = bolt_checkpoint.register_run_id(run_id)
 
-    return await _run_attribution_async_helper(
-        client=client,
-        trace_logging_svc=trace_logging_svc,
-        config=config,
-        dataset_id=dataset_id,
-        input_path=input_path,
-        timestamp=timestamp,
-        attribution_rule=attribution_rule,
-        aggregation_type=aggregation_type,
-        concurrency=concurrency,
-        num_files_per_mpc_container=num_files_per_mpc_container,
-        k_anonymity_threshold=k_anonymity_threshold,
-        stage_flow=stage_flow,
-        logger=logger,
-        num_tries=num_tries,
-        final_stage=final_stage,
-        run_id=run_id,
-        graphapi_version=graphapi_version,
-        graphapi_domain=graphapi_domain,
-    )
+    try:
+        return await _run_attribution_async_helper(
+            client=client,
+            trace_logging_svc=trace_logging_svc,
+            config=config,
+            dataset_id=dataset_id,
+            input_path=input_path,
+            timestamp=timestamp,
+            attribution_rule=attribution_rule,
+            aggregation_type=aggregation_type,
+            concurrency=concurrency,
+            num_files_per_mpc_container=num_files_per_mpc_container,
+            k_anonymity_threshold=k_anonymity_threshold,
+            stage_flow=stage_flow,
+            logger=logger,
+            num_tries=num_tries,
+            final_stage=final_stage,
+            run_id=run_id,
+            graphapi_version=graphapi_version,
+            graphapi_domain=graphapi_domain,
+        )
+    finally:
+        await client.close_session()
 
 
 @bolt_checkpoint(
@@ -241,21 +295,34 @@ async def _run_attribution_async_helper(
     graphapi_domain: Optional[str],
 ) -> BoltSummary:
 
-    try:
-        datasets_info = _get_attribution_dataset_info(client, dataset_id, logger)
-    except GraphAPIGenericException as err:
-        logger.error(err)
-        raise PCAttributionValidationException(
-            cause=f"Read attribution dataset {dataset_id} data failed.",
-            remediation=f"Check access token has permission to read dataset {dataset_id}",
-            exit_code=OneCommandRunnerExitCode.ERROR_READ_DATASET,
-        )
+    # dataset info and the existing instances are independent Graph API calls,
+    # so fetch them concurrently instead of serially
+    datasets_info, dataset_instance_data = await asyncio.gather(
+        _get_attribution_dataset_info(client, dataset_id, logger),
+        _get_existing_pa_instances(client, dataset_id),
+        return_exceptions=True,
+    )
+    if isinstance(datasets_info, BaseException):
+        if isinstance(datasets_info, GraphAPIGenericException):
+            logger.error(datasets_info)
+            raise PCAttributionValidationException(
+                cause=f"Read attribution dataset {dataset_id} data failed.",
+                remediation=f"Check access token has permission to read dataset {dataset_id}",
+                exit_code=OneCommandRunnerExitCode.ERROR_READ_DATASET,
+            )
+        raise datasets_info
+    if isinstance(dataset_instance_data, BaseException):
+        if isinstance(dataset_instance_data, GraphAPIGenericException):
+            logger.error(dataset_instance_data)
+            raise PCAttributionValidationException(
+                cause=f"Read dataset instance {dataset_id} failed.",
+                remediation=f"Check access token has permission to read dataset instance {dataset_id}",
+                exit_code=OneCommandRunnerExitCode.ERROR_READ_PA_INSTANCE,
+            )
+        raise dataset_instance_data
 
     datasets = datasets_info[DATASETS_INFORMATION]
     target_id = datasets_info[TARGET_ID]
-    # Verify adspixel
-    _verify_adspixel(target_id, client)
-    matched_data = {}
     attribution_rule_str = attribution_rule.name
     attribution_rule_val = attribution_rule.value
     instance_id = None
@@ -270,56 +337,65 @@ async def _run_attribution_async_helper(
     # b. timestamp
     if len(datasets) == 0:
         raise ValueError("Dataset for given parameters and dataset invalid")
-    for data in datasets:
-        if data["key"] == attribution_rule_str:
-            matched_attr = data["value"]
-
-    for m_data in matched_attr:
-        m_time = dateutil.parser.parse(m_data[TIMESTAMP])
-        if m_time == dt:
-            matched_data = m_data
-            break
+    matched_attr = next(
+        (data["value"] for data in datasets if data["key"] == attribution_rule_str),
+        [],
+    )
+
+    matched_data = next(
+        (
+            m_data
+            for m_data in matched_attr
+            if _parse_timestamp(m_data[TIMESTAMP]) == dt
+        ),
+        {},
+    )
     if len(matched_data) == 0:
         raise ValueError("No dataset matching to the information provided")
-    # Step 2: Validate what instances need to be created vs what already exist
-    # Conditions for retry:
-    # 1. Not in a terminal status
-    # 2. Instance has been created > 1d ago
+    # Verify adspixel concurrently with the instance lookup/creation below;
+    # the task is created only after input validation so the user-error raise
+    # paths above can't leak it pending
+    verify_adspixel_task = asyncio.create_task(_verify_adspixel(target_id, client))
     try:
-        dataset_instance_data = _get_existing_pa_instances(client, dataset_id)
-    except GraphAPIGenericException as err:
-        logger.error(err)
-        raise PCAttributionValidationException(
-            cause=f"Read dataset instance {dataset_id} failed.",
-            remediation=f"Check access token has permission to read dataset instance {dataset_id}",
-            exit_code=OneCommandRunnerExitCode.ERROR_READ_PA_INSTANCE,
+        # Step 2: Validate what instances need to be created vs what already exist
+        # Conditions for retry:
+        # 1. Not in a terminal status
+        # 2. Instance has been created > 1d ago
+        existing_instances = dataset_instance_data["data"]
+        exp_time = datetime.now(tz=timezone.utc) - timedelta(days=1)
+        for inst in existing_instances:
+            if _should_resume_instance(inst, dt, attribution_rule, exp_time):
+                instance_id = inst["id"]
+                break
+
+        if instance_id is None:
+            try:
+                instance_id = await _create_new_instance(
+                    dataset_id,
+                    int(dt_arg),
+                    attribution_rule_val,
+                    run_id,
+                    client,
+                    logger,
+                )
+                _invalidate_dataset_cache(dataset_id)
+            except GraphAPIGenericException as err:
+                logger.error(err)
+                raise PCAttributionValidationException(
+                    cause=f"Create dataset instance {dataset_id} failed.",
+                    remediation=f"Check access token has permission to create dataset instance {dataset_id}",
+                    exit_code=OneCommandRunnerExitCode.ERROR_CREATE_PA_INSTANCE,
+                )
+
+        instance_data, _ = await asyncio.gather(
+            _get_pa_instance_info(client, instance_id, logger),
+            verify_adspixel_task,
         )
-
-    existing_instances = dataset_instance_data["data"]
-    for inst in existing_instances:
-        if _should_resume_instance(inst, dt, attribution_rule):
-            instance_id = inst["id"]
-            break
-
-    if instance_id is None:
-        try:
-            instance_id = await _create_new_instance(
-                dataset_id,
-                int(dt_arg),
-                attribution_rule_val,
-                run_id,
-                client,
-                logger,
-            )
-        except GraphAPIGenericException as err:
-            logger.error(err)
-            raise PCAttributionValidationException(
-                cause=f"Create dataset instance {dataset_id} failed.",
-                remediation=f"Check access token has permission to create dataset instance {dataset_id}",
-                exit_code=OneCommandRunnerExitCode.ERROR_CREATE_PA_INSTANCE,
-            )
-
-    instance_data = await _get_pa_instance_info(client, instance_id, logger)
+    except BaseException:
+        # never leave the adspixel verification pending with nobody to
+        # retrieve its result
+        verify_adspixel_task.cancel()
+        raise
     _check_version(instance_data, config)
     # override stage flow based on pcs feature gate. Please contact PSI team to have a similar adoption
     stage_flow_override = stage_flow
@@ -425,16 +501,7 @@ async def run_bolt(
 
     runner = BoltRunner(
         publisher_client=publisher_client,
-        partner_client=BoltPCSClient(
-            build_private_computation_service(
-                pc_config=config["private_computation"],
-                mpc_config=config["mpc"],
-                pid_config=config["pid"],
-                pph_config=config.get("post_processing_handlers", {}),
-                pid_pph_config=config.get("pid_post_processing_handlers", {}),
-                trace_logging_svc=trace_logging_svc,
-            ),
-        ),
+        partner_client=_get_pcs_client(config, trace_logging_svc),
         logger=logger,
         max_parallel_runs=MAX_NUM_INSTANCES,
     )
@@ -443,6 +510,47 @@ async def run_bolt(
     return await runner.run_async(job_list)
 
 
+_pcs_client_memo: Optional[Tuple[Dict[str, Any], BoltPCSClient]] = None
+
+
+def _get_pcs_client(
+    config: Dict[str, Any], trace_logging_svc: TraceLoggingService
+) -> BoltPCSClient:
+    """Builds the partner BoltPCSClient, reusing the previous one when called
+    again with the same config.
+
+    build_private_computation_service constructs the whole PCS object graph
+    (MPC, PID, post-processing handlers), which is expensive to repeat when
+    run_bolt is invoked once per timestamp in the same process. Config dicts
+    are not hashable, so the single-entry memo compares by identity; it is
+    keyed on config alone because run_attribution_async builds a fresh trace
+    logger per call, so the cached service keeps the trace logger from the
+    first call with this config.
+    """
+    global _pcs_client_memo
+    memo = _pcs_client_memo
+    if memo is not None and memo[0] is config:
+        return memo[1]
+
+    # deferred: pulls in the PCS service stack
+    from fbpcs.private_computation_cli.private_computation_service_wrapper import (
+        build_private_computation_service,
+    )
+
+    pcs_client = BoltPCSClient(
+        build_private_computation_service(
+            pc_config=config["private_computation"],
+            mpc_config=config["mpc"],
+            pid_config=config["pid"],
+            pph_config=config.get("post_processing_handlers", {}),
+            pid_pph_config=config.get("pid_post_processing_handlers", {}),
+            trace_logging_svc=trace_logging_svc,
+        ),
+    )
+    _pcs_client_memo = (config, pcs_client)
+    return pcs_client
+
+
 @bolt_checkpoint(
     dump_params=True,
     include=["dataset_id", "timestamp", "attribution_rule"],
@@ -493,6 +601,11 @@ def _check_version(
     if not instance_tier_str:
         return
 
+    # deferred: pulls in the PCS service stack
+    from fbpcs.private_computation_cli.private_computation_service_wrapper import (
+        get_tier,
+    )
+
     config_tier = get_tier(config)
     expected_tier = PCSTier.from_str(instance_tier_str)
     if expected_tier is not config_tier:
@@ -501,33 +614,54 @@ def _check_version(
         )
 
 
-def _is_unix_ts(timestamp: str) -> bool:
+def _parse_timestamp(timestamp: str) -> datetime:
+    """Parses a Graph API timestamp.
+
+    datetime.fromisoformat is much faster than dateutil.parser.parse but does
+    not accept compact UTC offsets like "+0000" until Python 3.11, so those
+    are normalized first; anything else falls back to dateutil.
+    """
+    ts = timestamp
+    if ts.endswith("Z"):
+        ts = ts[:-1] + "+00:00"
+    elif len(ts) > 5 and ts[-5] in "+-" and ts[-4:].isdigit():
+        ts = f"{ts[:-2]}:{ts[-2:]}"
     try:
-        int(timestamp)
-        return True
+        return datetime.fromisoformat(ts)
     except ValueError:
-        return False
+        import dateutil.parser
+
+        return dateutil.parser.parse(timestamp)
 
 
 def timestamp_to_dt(timestamp: str) -> datetime:
-    pacific_timezone = pytz.timezone("US/Pacific")
-    # Validate if input is datetime or timestamp
-    is_date_format = _iso_date_validator(timestamp)
-    if is_date_format:
-        return pacific_timezone.localize(datetime.strptime(timestamp, "%Y-%m-%d"))
-    elif _is_unix_ts(timestamp):
+    # dispatch on the shape of the input instead of exception-driven probing
+    if timestamp.isdigit():
+        # unix timestamp
         return datetime.fromtimestamp(int(timestamp), tz=timezone.utc)
-    else:
-        return dateutil.parser.parse(timestamp)
+    if len(timestamp) == 10 and timestamp[4] == "-" and timestamp[7] == "-":
+        # plain YYYY-MM-DD date
+        return _pacific_timezone().localize(datetime.strptime(timestamp, "%Y-%m-%d"))
+    import dateutil.parser
+
+    return dateutil.parser.parse(timestamp)
 
 
-@bolt_checkpoint(dump_params=True, dump_return_val=True, component=LOG_COMPONENT)
+# no @bolt_checkpoint: this predicate runs once per existing instance per
+# call, and serializing its dict params through the trace logger costs more
+# than the check itself
 def _should_resume_instance(
-    inst: Dict[str, Any], dt: datetime, attribution_rule: AttributionRule
+    inst: Dict[str, Any],
+    dt: datetime,
+    attribution_rule: AttributionRule,
+    exp_time: Optional[datetime] = None,
+    inst_time: Optional[datetime] = None,
 ) -> bool:
-    inst_time = dateutil.parser.parse(inst[TIMESTAMP])
-    creation_time = dateutil.parser.parse(inst[CREATED_TIME])
-    exp_time = datetime.now(tz=timezone.utc) - timedelta(days=1)
+    if inst_time is None:
+        inst_time = _parse_timestamp(inst[TIMESTAMP])
+    creation_time = _parse_timestamp(inst[CREATED_TIME])
+    if exp_time is None:
+        exp_time = datetime.now(tz=timezone.utc) - timedelta(days=1)
     expired = exp_time > creation_time
     return (
         inst[ATTRIBUTION_RULE] == attribution_rule.value
@@ -537,17 +671,16 @@ def _should_resume_instance(
     )
 
 
-@bolt_checkpoint(dump_params=True, dump_return_val=True, component=LOG_COMPONENT)
 def _get_pcs_features(instance: Dict[str, Any]) -> Optional[List[str]]:
     return instance.get(FEATURE_LIST)
 
 
 @bolt_checkpoint(dump_params=True, include=["adpixels_id"], component=LOG_COMPONENT)
-def _verify_adspixel(
+async def _verify_adspixel(
     adspixels_id: str, client: BoltGraphAPIClient[BoltPAGraphAPICreateInstanceArgs]
 ) -> None:
     try:
-        client.get_adspixels(adspixels_id=adspixels_id, fields=["id"])
+        await client.get_adspixels(adspixels_id=adspixels_id, fields=["id"])
     except GraphAPIGenericException:
         raise PCAttributionValidationException(
             cause=f"Read adspixel {adspixels_id} failed.",
@@ -571,12 +704,16 @@ def get_attribution_dataset_info(
         graphapi_domain=graphapi_domain,
     )
 
-    return json.loads(
-        client.get_attribution_dataset_info(
-            dataset_id,
-            [DATASETS_INFORMATION, TARGET_ID],
-        ).text
-    )
+    async def _fetch_dataset_info() -> Any:
+        try:
+            return await client.get_attribution_dataset_info(
+                dataset_id,
+                [DATASETS_INFORMATION, TARGET_ID],
+            )
+        finally:
+            await client.close_session()
+
+    return _get_event_loop().run_until_complete(_fetch_dataset_info())
 
 
 def get_runnable_timestamps(
@@ -595,7 +732,15 @@ def get_runnable_timestamps(
         graphapi_domain=graphapi_domain,
     )
 
-    datasets_info = _get_attribution_dataset_info(client, dataset_id, logger)
+    async def _fetch_dataset_state() -> Tuple[Any, Any]:
+        try:
+            return await _get_dataset_info_and_instances(client, dataset_id, logger)
+        finally:
+            await client.close_session()
+
+    datasets_info, dataset_instance_data = _get_event_loop().run_until_complete(
+        _fetch_dataset_state()
+    )
     datasets = datasets_info[DATASETS_INFORMATION]
     matching_datasets = [
         data["value"] for data in datasets if data["key"] == attribution_rule.name
@@ -606,14 +751,20 @@ def get_runnable_timestamps(
 
     possible_timestamps = {d[TIMESTAMP] for d in matching_datasets[0]}
 
-    dataset_instance_data = _get_existing_pa_instances(client, dataset_id)
     existing_instances = dataset_instance_data["data"]
 
     timestamps_to_exclude = set()
+    exp_time = datetime.now(tz=timezone.utc) - timedelta(days=1)
     for inst in existing_instances:
         timestamp = inst[TIMESTAMP]
-        dt = dateutil.parser.parse(timestamp)
-        if _should_resume_instance(inst, dt, attribution_rule):
+        # only instances for candidate timestamps can affect the result, and
+        # one blocking instance per timestamp is enough
+        if timestamp not in possible_timestamps or timestamp in timestamps_to_exclude:
+            continue
+        dt = _parse_timestamp(timestamp)
+        if _should_resume_instance(
+            inst, dt, attribution_rule, exp_time, inst_time=dt
+        ):
             timestamps_to_exclude.add(timestamp)
 
     runnable_timestamps = possible_timestamps.difference(timestamps_to_exclude)
@@ -624,23 +775,26 @@ def get_runnable_timestamps(
     return runnable_timestamps
 
 
+async def _get_dataset_info_and_instances(
+    client: BoltGraphAPIClient[BoltPAGraphAPICreateInstanceArgs],
+    dataset_id: str,
+    logger: logging.Logger,
+) -> Tuple[Any, Any]:
+    """Fetches the dataset information and the existing PA instances concurrently."""
+    datasets_info, dataset_instance_data = await asyncio.gather(
+        _get_attribution_dataset_info(client, dataset_id, logger),
+        _get_existing_pa_instances(client, dataset_id),
+    )
+    return datasets_info, dataset_instance_data
+
+
 @bolt_checkpoint(component=LOG_COMPONENT)
 async def _get_pa_instance_info(
     client: BoltGraphAPIClient[BoltPAGraphAPICreateInstanceArgs],
     instance_id: str,
     logger: logging.Logger,
 ) -> Any:
-    return json.loads((await client.get_instance(instance_id)).text)
-
-
-def _iso_date_validator(timestamp: str) -> Any:
-    try:
-        datetime.strptime(timestamp, "%Y-%m-%d")
-        return True
-    except Exception:
-        pass
-    else:
-        return False
+    return await client.get_instance(instance_id)
 
 
 @bolt_checkpoint(
@@ -648,17 +802,20 @@ def _iso_date_validator(timestamp: str) -> Any:
     include=["dataset_id"],
     component=LOG_COMPONENT,
 )
-def _get_attribution_dataset_info(
+async def _get_attribution_dataset_info(
     client: BoltGraphAPIClient[BoltPAGraphAPICreateInstanceArgs],
     dataset_id: str,
     logger: logging.Logger,
 ) -> Any:
-    return json.loads(
-        client.get_attribution_dataset_info(
-            dataset_id,
-            [DATASETS_INFORMATION, TARGET_ID],
-        ).text
+    cached = _dataset_info_cache.get(dataset_id)
+    if cached is not None and monotonic() - cached[0] < DATASET_CACHE_TTL:
+        return cached[1]
+    datasets_info = await client.get_attribution_dataset_info(
+        dataset_id,
+        [DATASETS_INFORMATION, TARGET_ID],
     )
+    _dataset_info_cache[dataset_id] = (monotonic(), datasets_info)
+    return datasets_info
 
 
 @bolt_checkpoint(
@@ -666,7 +823,12 @@ def _get_attribution_dataset_info(
     include=["dataset_id"],
     component=LOG_COMPONENT,
 )
-def _get_existing_pa_instances(
+async def _get_existing_pa_instances(
     client: BoltGraphAPIClient[BoltPAGraphAPICreateInstanceArgs], dataset_id: str
 ) -> Any:
-    return json.loads(client.get_existing_pa_instances(dataset_id).text)
+    cached = _pa_instances_cache.get(dataset_id)
+    if cached is not None and monotonic() - cached[0] < DATASET_CACHE_TTL:
+        return cached[1]
+    dataset_instance_data = await client.get_existing_pa_instances(dataset_id)
+    _pa_instances_cache[dataset_id] = (monotonic(), dataset_instance_data)
+    return dataset_instance_data
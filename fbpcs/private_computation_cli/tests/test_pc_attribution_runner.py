@@ -11,7 +11,7 @@ import logging
 
 from datetime import datetime, timezone
 from unittest import TestCase
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from fbpcs.private_computation import pc_attribution_runner
 from fbpcs.private_computation.entity.product_config import AttributionRule
@@ -20,7 +20,8 @@ from fbpcs.private_computation.entity.product_config import AttributionRule
 class TestPcAttributionRunner(TestCase):
     @patch(
         "fbpcs.private_computation.pc_attribution_runner.BoltGraphAPIClient",
-        new=MagicMock(),
+        # close_session needs an awaitable mock
+        new=MagicMock(return_value=MagicMock(close_session=AsyncMock())),
     )
     @patch(
         "fbpcs.private_computation.pc_attribution_runner.datetime",
@@ -29,6 +30,8 @@ class TestPcAttributionRunner(TestCase):
         mock_datetime.now = MagicMock(
             return_value=datetime(2022, 10, 27, 23, 27, 55, 204663, tzinfo=timezone.utc)
         )
+        # timestamp parsing should behave normally; only "now" is frozen
+        mock_datetime.fromisoformat = datetime.fromisoformat
 
         dataset_id = "123"
         target_id = "456"
@@ -125,10 +128,10 @@ class TestPcAttributionRunner(TestCase):
             ],
         }
 
-        pc_attribution_runner._get_attribution_dataset_info = MagicMock(
+        pc_attribution_runner._get_attribution_dataset_info = AsyncMock(
             return_value=datasets_info
         )
-        pc_attribution_runner._get_existing_pa_instances = MagicMock(
+        pc_attribution_runner._get_existing_pa_instances = AsyncMock(
             return_value=instance_data
         )
 
@@ -12,11 +12,10 @@ import json
 import logging
 import random
 import time
-from typing import Any, List
+from typing import Any, Dict, List
 from unittest import TestCase
-from unittest.mock import MagicMock, patch, PropertyMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
-import requests
 from fbpcs.pl_coordinator import pl_study_runner
 from fbpcs.pl_coordinator.exceptions import (
     GraphAPIGenericException,
@@ -88,6 +87,9 @@ class TestPlStudyRunner(TestCase):
         self.mock_graph_api_client = mock_graph_api_client
         self.client_mock = MagicMock()
         self.client_mock.get_study_data.return_value = self.response_mock
+        # async client methods need awaitable mocks
+        self.client_mock.get_adspixels = AsyncMock()
+        self.client_mock.close_session = AsyncMock()
         BoltGraphAPIClientMock.return_value = self.client_mock
         self.mock_logger = mock_logger
         self.num_shards = 2
@@ -530,15 +532,6 @@ class TestPlStudyRunner(TestCase):
 
     async def _get_graph_api_output(
         self, status: str, feature_list: List[str]
-    ) -> requests.Response:
-        data = {"status": status, "feature_list": feature_list}
-        r = requests.Response()
-        r.status_code = 200
-        # pyre-ignore
-        type(r).text = PropertyMock(return_value=json.dumps(data))
-
-        def json_func(**kwargs) -> Any:
-            return data
-
-        r.json = json_func
-        return r
+    ) -> Dict[str, Any]:
+        # get_instance returns parsed dicts
+        return {"status": status, "feature_list": feature_list}